@@ -1 +1,10 @@
 # Package init for auditoria_extractor
+
+import logging
+import os
+
+# Tesseract rinde mejor con 1 hilo OpenMP por proceso (y varias páginas en
+# paralelo); se fija aquí para que aplique antes de importar pytesseract/tesserocr.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+logging.getLogger(__name__).debug("OMP_THREAD_LIMIT=%s", os.environ["OMP_THREAD_LIMIT"])
@@ -23,9 +23,24 @@ VALID_INPUT_EXTENSIONS = [".pdf", ".jpg", ".jpeg", ".png", ".tiff"]
 OCR_CONFIG = {
     "lang": "spa",   # idioma: español (puedes agregar "eng+spa" si quieres bilingüe)
     "psm": 6,        # page segmentation mode (6 = bloques de texto)
-    "oem": 3,        # OCR Engine Mode (3 = default)
+    "oem": 1,        # OCR Engine Mode (1 = solo LSTM; pensado para modelos tessdata-fast)
 }
 
+# Render de páginas escaneadas para OCR: las hojas grandes (planos) bajan el
+# zoom para que su lado más largo no supere max_side_px
+OCR_RENDER_CONFIG = {
+    "max_zoom": 2.0,
+    "min_zoom": 1.0,
+    "max_side_px": 4200,  # ≈ 300 dpi en el lado largo de una hoja oficio
+}
+
+# Cantidad de páginas que se envían a OCR en paralelo dentro de un PDF
+OCR_MAX_WORKERS = os.cpu_count() or 1
+
+# Cantidad de PDFs que se procesan en paralelo (un proceso por PDF) en
+# pipeline.process_pdfs; dentro de cada proceso el OCR usa un solo hilo
+PDF_MAX_WORKERS = os.cpu_count() or 1
+
 # Opcional: configuración simple de logging
 LOGGING_CONFIG = {
     "level": "INFO",  # DEBUG / INFO / WARNING / ERROR
@@ -4,7 +4,9 @@ Conversión de números escritos en español a enteros.
 Ej: "cinco millones doscientos mil" -> 5200000
 """
 
-import regex as re
+import re
+from functools import lru_cache
+from typing import Iterator, Tuple
 
 UNIDADES = {
     "cero": 0,
@@ -67,21 +69,91 @@ MULTIPLICADORES = {
 }
 
 
+# Tabla única token -> (valor, tipo) para resolver cada palabra con un solo lookup
+_SUMA = 0
+_MULTIPLICA = 1
+_CONECTOR = 2
+
+_PALABRAS = {
+    **{k: (v, _SUMA) for k, v in UNIDADES.items()},
+    **{k: (v, _SUMA) for k, v in ESPECIALES.items()},
+    **{k: (v, _SUMA) for k, v in DECENAS.items()},
+    **{k: (v, _SUMA) for k, v in CENTENAS.items()},
+    **{k: (v, _MULTIPLICA) for k, v in MULTIPLICADORES.items()},
+    # Conector, se ignora ("treinta y dos" -> treinta + dos)
+    "y": (0, _CONECTOR),
+}
+
+# Minúsculas + tildes en una sola pasada (el resto de mayúsculas no ASCII,
+# como la Ñ, termina igual como espacio en _PAT_NO_ALFA)
+_TABLA_NORMALIZACION = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜáéíóúü",
+    "abcdefghijklmnopqrstuvwxyzaeiouuaeiouu",
+)
+
+_PAT_NO_ALFA = re.compile(r"[^a-z \t\r\n\f\v]")
+
+# Palabras numéricas ya normalizadas, de la más larga a la más corta, para
+# separar tokens que el OCR dejó pegados ("cincomil" -> "cinco" "mil")
+_PAT_PALABRA_NUMERO = re.compile(
+    "|".join(
+        sorted(
+            {k.translate(_TABLA_NORMALIZACION) for k in _PALABRAS},
+            key=len,
+            reverse=True,
+        )
+    )
+)
+
+
 def normalize_text_number(text: str) -> str:
     """Limpia tildes y caracteres innecesarios para el parseo."""
-    text = text.lower()
-    text = text.replace("á", "a").replace("é", "e").replace("í", "i") \
-               .replace("ó", "o").replace("ú", "u").replace("ü", "u")
-    text = re.sub(r"[^a-z\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    text = text.translate(_TABLA_NORMALIZACION)
+    text = _PAT_NO_ALFA.sub(" ", text)
+    return " ".join(text.split())
+
+
+def _separar_pegadas(token: str) -> list[str] | None:
+    """
+    Parte un token desconocido en palabras numéricas contiguas
+    ("doscientosmil" -> ["doscientos", "mil"]).
+    Devuelve None si queda algún trozo sin reconocer.
+    """
+    trozos = []
+    pos = 0
+    while pos < len(token):
+        m = _PAT_PALABRA_NUMERO.match(token, pos)
+        if m is None:
+            return None
+        trozos.append(m.group())
+        pos = m.end()
+    return trozos
+
+
+def _valores(text: str) -> Iterator[Tuple[int, int]]:
+    """
+    (valor, tipo) de cada palabra numérica de un texto ya normalizado,
+    separando las palabras pegadas; las desconocidas se ignoran.
+    """
+    palabras = _PALABRAS
+    for token in text.split():
+        info = palabras.get(token)
+        if info is not None:
+            yield info
+        else:
+            for trozo in _separar_pegadas(token) or ():
+                yield palabras[trozo]
 
 
+# Las mismas frases (sobre todo años: "DOS MIL VEINTE") se repiten entre
+# páginas y documentos; la función es pura, así que se memoriza
+@lru_cache(maxsize=4096)
 def text_number_to_int(text: str) -> int | None:
     """
     Convierte un número en palabras en español a entero.
     Soporta expresiones típicas: "cinco millones doscientos mil", "ciento veinte mil",
     "tres mil cuatrocientos cincuenta y dos", etc.
+    Tolera palabras pegadas por el OCR: "cincomil" -> 5000.
     """
     if not text:
         return None
@@ -90,33 +162,16 @@ def text_number_to_int(text: str) -> int | None:
     if not text:
         return None
 
-    tokens = text.split()
-
     total = 0
     current = 0
 
-    for token in tokens:
-        if token in UNIDADES:
-            current += UNIDADES[token]
-        elif token in ESPECIALES:
-            current += ESPECIALES[token]
-        elif token in DECENAS:
-            current += DECENAS[token]
-        elif token in CENTENAS:
-            current += CENTENAS[token]
-        elif token == "y":
-            # Conector, se ignora ("treinta y dos" -> treinta + dos)
-            continue
-        elif token in MULTIPLICADORES:
-            factor = MULTIPLICADORES[token]
-            if current == 0:
-                current = 1
-            current *= factor
+    for valor, tipo in _valores(text):
+        if tipo == _SUMA:
+            current += valor
+        elif tipo == _MULTIPLICA:
+            current = current * valor if current else valor
             total += current
             current = 0
-        else:
-            # Palabra desconocida, dejamos el parser "tolerante"
-            continue
 
     total += current
 
@@ -131,6 +186,7 @@ if __name__ == "__main__":
         "un millon",
         "doce mil",
         "novecientos noventa y nueve mil novecientos noventa y nueve",
+        "doscientosmil",
     ]
     for e in ejemplos:
         print(e, "->", text_number_to_int(e))
@@ -3,30 +3,94 @@
 """
 ocr_engine.py
 Envuelve Tesseract OCR para extraer texto desde imágenes.
+
+Si `tesserocr` está instalado se usa la API en proceso (el modelo se carga
+una sola vez y se reutiliza entre páginas); si no, se cae a `pytesseract`,
+que lanza un proceso `tesseract` por imagen.
 """
 
+import threading
 from typing import Optional
 
 from PIL import Image
 import pytesseract
 
+try:
+    import tesserocr  # opcional: API de Tesseract en proceso
+except ImportError:
+    tesserocr = None
+
 from .config import OCR_CONFIG
 
 
+class OCREngine:
+    """
+    Motor OCR reutilizable entre páginas.
+    Con tesserocr mantiene viva una instancia de Tesseract; no es thread-safe,
+    por eso cada hilo usa la suya (ver get_engine).
+    """
+
+    def __init__(self):
+        self.api = None
+        if tesserocr is not None:
+            try:
+                self.api = tesserocr.PyTessBaseAPI(
+                    lang=OCR_CONFIG["lang"],
+                    oem=OCR_CONFIG["oem"],
+                    psm=OCR_CONFIG["psm"],
+                )
+            except RuntimeError as e:
+                print(f"[WARN] No se pudo iniciar tesserocr, se usa pytesseract: {e}")
+                self.api = None
+
+    def image_to_text(self, image: Image.Image) -> Optional[str]:
+        """
+        Aplica OCR a una imagen PIL y devuelve el texto reconocido (o None si falla).
+        """
+        if image is None:
+            return None
+
+        try:
+            if self.api is not None:
+                self.api.SetImage(image)
+                return self.api.GetUTF8Text()
+
+            # Configurar Tesseract: idioma + psm + oem
+            tesseract_config = f'-l {OCR_CONFIG["lang"]} --oem {OCR_CONFIG["oem"]} --psm {OCR_CONFIG["psm"]}'
+            return pytesseract.image_to_string(image, config=tesseract_config)
+        except Exception as e:
+            # En una versión más avanzada, podríamos loguear este error
+            print(f"[WARN] Error en OCR: {e}")
+            return None
+
+    def close(self) -> None:
+        """Libera la instancia de Tesseract (si la hay)."""
+        if self.api is not None:
+            self.api.End()
+            self.api = None
+
+    def __del__(self):
+        self.close()
+
+
+_local = threading.local()
+
+
+def get_engine() -> OCREngine:
+    """Devuelve el motor OCR del hilo actual, creándolo la primera vez."""
+    engine = getattr(_local, "engine", None)
+    if engine is None:
+        engine = OCREngine()
+        _local.engine = engine
+    return engine
+
+
 def ocr_image_to_text(image: Image.Image) -> Optional[str]:
     """
     Aplica OCR a una imagen PIL y devuelve el texto reconocido (o None si falla).
+    Reutiliza el motor del hilo actual entre llamadas.
     """
     if image is None:
         return None
 
-    # Configurar Tesseract: idioma + psm + oem
-    tesseract_config = f'-l {OCR_CONFIG["lang"]} --oem {OCR_CONFIG["oem"]} --psm {OCR_CONFIG["psm"]}'
-
-    try:
-        text = pytesseract.image_to_string(image, config=tesseract_config)
-        return text
-    except Exception as e:
-        # En una versión más avanzada, podríamos loguear este error
-        print(f"[WARN] Error en OCR: {e}")
-        return None
+    return get_engine().image_to_text(image)
@@ -6,19 +6,40 @@ Carga PDFs y decide por página si usar texto directo o OCR.
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Any, Iterator, Optional, Tuple
 
 import fitz  # PyMuPDF
 from PIL import Image
-import io
 
+from .config import OCR_MAX_WORKERS, OCR_RENDER_CONFIG
 from .ocr_engine import ocr_image_to_text
 
+# Pools de hilos para OCR, uno por cantidad de hilos y compartidos entre
+# PDFs: cada hilo guarda su motor (ocr_engine.get_engine), así que reusar el
+# pool evita recargar el modelo de Tesseract en cada archivo
+_ejecutores: Dict[int, ThreadPoolExecutor] = {}
+_ejecutores_lock = threading.Lock()
+# Un proceso hijo (fork) hereda el dict pero no los hilos
+os.register_at_fork(after_in_child=_ejecutores.clear)
+
+
+def _ejecutor_ocr(workers: int) -> ThreadPoolExecutor:
+    """Pool de OCR del proceso para `workers` hilos, creado la primera vez."""
+    with _ejecutores_lock:
+        executor = _ejecutores.get(workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr")
+            _ejecutores[workers] = executor
+        return executor
+
 
 class PDFLoader:
     """Carga un PDF y entrega texto página por página, usando OCR si es necesario."""
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, ocr_workers: Optional[int] = None):
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"El archivo no existe: {filepath}")
 
@@ -27,78 +48,147 @@ class PDFLoader:
 
         self.filepath = filepath
         self.doc = fitz.open(filepath)
+        self.ocr_workers = ocr_workers or OCR_MAX_WORKERS
+        # Caché por índice de página: (texto, modo)
+        self._page_cache: Dict[int, Tuple[str, str]] = {}
+
+    @staticmethod
+    def _ocr_zoom(page: fitz.Page) -> float:
+        """
+        Zoom de render para OCR: max_zoom en hojas normales, menor en hojas
+        grandes para acotar los píxeles (el costo crece con el cuadrado del zoom).
+        """
+        lado_mayor = max(page.rect.width, page.rect.height)
+        zoom = OCR_RENDER_CONFIG["max_zoom"]
+        if lado_mayor > 0:
+            zoom = min(zoom, OCR_RENDER_CONFIG["max_side_px"] / lado_mayor)
+        return max(OCR_RENDER_CONFIG["min_zoom"], zoom)
 
-    def _page_to_image(self, page_index: int, zoom: float = 2.0) -> Image.Image:
+    def _page_to_image(self, page_index: int, zoom: Optional[float] = None) -> Image.Image:
         """Renderiza una página del PDF como imagen PIL para OCR."""
         page = self.doc[page_index]
+        if zoom is None:
+            zoom = self._ocr_zoom(page)
         matrix = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=matrix)
-        img_bytes = pix.tobytes("png")
-        img = Image.open(io.BytesIO(img_bytes))
+        pix = page.get_pixmap(matrix=matrix, alpha=False)
+        # Construimos la imagen directo desde los píxeles (sin pasar por PNG)
+        mode = "RGB" if pix.n == 3 else "L"
+        img = Image.frombytes(mode, (pix.width, pix.height), pix.samples)
         return img
 
-    def get_page_text(self, page_index: int, use_ocr_if_empty: bool = True) -> str:
+    def _digital_text(self, page_index: int) -> str:
+        """Texto seleccionable de la página (sin OCR), ya sin espacios extremos."""
+        page = self.doc[page_index]
+        raw_text = page.get_text("text") or ""
+        return raw_text.strip()
+
+    def _has_visual_content(self, page_index: int) -> bool:
         """
-        Retorna el texto de una página:
-        - Si la página tiene texto real → usa ese.
-        - Si no tiene texto y use_ocr_if_empty=True → aplica OCR sobre la imagen.
+        True si la página contiene alguna imagen (incluidas las inline) o
+        dibujos vectoriales. Una página escaneada siempre tiene imagen; el
+        texto trazado como curvas (fuentes convertidas, exportaciones CAD de
+        planos de mensura) solo aparece como dibujo. Sin texto, imágenes ni
+        dibujos la página está en blanco y no vale la pena renderizarla.
         """
         page = self.doc[page_index]
-        raw_text = page.get_text("text") or ""
-        clean_text = raw_text.strip()
+        # get_image_info es barato; de los dibujos basta saber si hay alguno:
+        # get_cdrawings no arma los dicts de get_drawings y next() corta en
+        # el primero
+        return bool(page.get_image_info()) or next(iter(page.get_cdrawings()), None) is not None
+
+    def _extract_one_page(self, page_index: int, use_ocr_if_empty: bool = True) -> Tuple[str, str]:
+        """
+        Devuelve (texto, modo) de una página, con modo "digital" | "ocr" | "empty".
+        El resultado queda en caché por índice, así que repetir la misma
+        página no vuelve a renderizar ni a pasar por OCR.
+        """
+        cached = self._page_cache.get(page_index)
+        if cached is not None:
+            return cached
 
         # Si hay texto "real" (carácteres seleccionables), lo usamos.
+        clean_text = self._digital_text(page_index)
         if clean_text:
-            return clean_text
-
-        # Si no hay texto, probamos con OCR (caso páginas escaneadas)
-        if use_ocr_if_empty:
-            img = self._page_to_image(page_index)
-            ocr_text = ocr_image_to_text(img)
-            return (ocr_text or "").strip()
+            result = (clean_text, "digital")
+        elif not use_ocr_if_empty:
+            # No se guarda: una llamada posterior con OCR podría encontrar texto
+            return "", "empty"
+        elif not self._has_visual_content(page_index):
+            result = ("", "empty")
+        else:
+            # Si no hay texto, probamos con OCR (caso páginas escaneadas)
+            ocr_text = ocr_image_to_text(self._page_to_image(page_index))
+            result = ((ocr_text or "").strip(), "ocr")
+
+        self._page_cache[page_index] = result
+        return result
 
-        return ""
+    def get_page_text(self, page_index: int, use_ocr_if_empty: bool = True) -> str:
+        """
+        Retorna el texto de una página:
+        - Si la página tiene texto real → usa ese.
+        - Si no tiene texto y use_ocr_if_empty=True → aplica OCR sobre la imagen.
+        """
+        return self._extract_one_page(page_index, use_ocr_if_empty)[0]
 
-    def iter_pages(self, use_ocr_if_empty: bool = True) -> List[Dict[str, Any]]:
+    def iter_pages(self, use_ocr_if_empty: bool = True) -> Iterator[Dict[str, Any]]:
         """
-        Recorre todas las páginas y devuelve una lista de dicts:
-        [
-          { "page": 1, "text": "...", "source": "digital" | "ocr" },
-          ...
-        ]
+        Recorre todas las páginas y va entregando (yield) un dict por página,
+        en orden:
+          { "page_number": 1, "text": "...", "mode": "digital" | "ocr" | "empty" }
+
+        Las páginas escaneadas se envían a OCR en paralelo, con a lo más
+        2 × ocr_workers páginas en vuelo, de modo que el consumidor puede ir
+        procesando las primeras mientras se reconocen las siguientes.
+        Comparte la caché de páginas con get_page_text.
         """
-        results: List[Dict[str, Any]] = []
-
-        for i in range(len(self.doc)):
-            page = self.doc[i]
-            raw_text = page.get_text("text") or ""
-            clean_text = raw_text.strip()
-
-            if clean_text:
-                results.append(
-                    {
-                        "page_number": i + 1,
-                        "text": clean_text,
-                        "mode": "digital",  # texto directo del PDF
-                    }
-                )
-            elif use_ocr_if_empty:
-                img = self._page_to_image(i)
-                ocr_text = ocr_image_to_text(img) or ""
-                results.append(
-                    {
-                        "page_number": i + 1,
-                        "text": ocr_text.strip(),
-                        "mode": "ocr",  # texto obtenido vía OCR
-                    }
-                )
-            else:
-                results.append(
-                    {
-                        "page_number": i + 1,
-                        "text": "",
-                        "mode": "empty",
-                    }
-                )
-
-        return results
+        ventana = self.ocr_workers * 2
+        # Páginas aún no entregadas: (dict de la página, futuro del OCR o None)
+        pendientes: Deque[Tuple[Dict[str, Any], Optional[Future]]] = deque()
+
+        # pytesseract lanza un subproceso por imagen: con hilos basta
+        executor = _ejecutor_ocr(self.ocr_workers)
+        try:
+            for i in range(len(self.doc)):
+                futuro: Optional[Future] = None
+                if i in self._page_cache or not use_ocr_if_empty:
+                    text, mode = self._extract_one_page(i, use_ocr_if_empty)
+                else:
+                    text = self._digital_text(i)
+                    if text:
+                        mode = "digital"  # texto directo del PDF
+                        self._page_cache[i] = (text, mode)
+                    elif not self._has_visual_content(i):
+                        mode = "empty"  # página en blanco: nada que reconocer
+                        self._page_cache[i] = (text, mode)
+                    else:
+                        # El render usa el documento (no es thread-safe): se hace
+                        # aquí, y solo el OCR se reparte entre hilos
+                        futuro = executor.submit(ocr_image_to_text, self._page_to_image(i))
+                        mode = "ocr"  # texto obtenido vía OCR
+                pendientes.append(({"page_number": i + 1, "text": text, "mode": mode}, futuro))
+
+                # Entregamos lo que ya está listo al frente de la cola; si la
+                # ventana se llenó, esperamos al OCR de la página más antigua
+                while pendientes and (
+                    pendientes[0][1] is None
+                    or pendientes[0][1].done()
+                    or len(pendientes) > ventana
+                ):
+                    yield self._resolver_pagina(*pendientes.popleft())
+
+            while pendientes:
+                yield self._resolver_pagina(*pendientes.popleft())
+        finally:
+            # Si el consumidor corta antes, no seguimos con OCR que nadie leerá
+            # (el pool sigue vivo para el próximo PDF)
+            for _, futuro in pendientes:
+                if futuro is not None:
+                    futuro.cancel()
+
+    def _resolver_pagina(self, info: Dict[str, Any], futuro: Optional[Future]) -> Dict[str, Any]:
+        """Completa el texto de una página OCR esperando su resultado (y lo guarda en caché)."""
+        if futuro is not None:
+            info["text"] = (futuro.result() or "").strip()
+            self._page_cache[info["page_number"] - 1] = (info["text"], info["mode"])
+        return info
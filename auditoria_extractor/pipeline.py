@@ -6,29 +6,37 @@ Orquesta el proceso completo:
 - carga el PDF
 - obtiene texto por página (digital u OCR)
 - aplica parsers para extraer campos legales & coordenadas
+
+Para lotes de PDFs, process_pdfs es el punto de entrada recomendado:
+reparte los archivos entre procesos.
 """
 
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 import os
 
+from .config import PDF_MAX_WORKERS
 from .pdf_loader import PDFLoader
-from .text_parsers import extract_all
+from .text_parsers import empty_result, extract_all
 
 
-def process_pdf(filepath: str) -> List[Dict[str, Any]]:
+def process_pdf(filepath: str, ocr_workers: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Procesa un PDF completo y devuelve una lista de dicts con la información
     extraída por página.
 
     Cada elemento tiene forma:
     {
+        ...campos de extract_all...,
         "archivo": "nombre.pdf",
         "pagina": 1,
-        "mode": "digital" | "ocr",
-        ...campos de extract_all...
+        "mode": "digital" | "ocr" | "empty",
     }
+
+    ocr_workers: páginas en OCR en paralelo (por defecto, config.OCR_MAX_WORKERS).
     """
-    loader = PDFLoader(filepath)
+    loader = PDFLoader(filepath, ocr_workers=ocr_workers)
     basename = os.path.basename(filepath)
 
     page_results: List[Dict[str, Any]] = []
@@ -39,17 +47,38 @@ def process_pdf(filepath: str) -> List[Dict[str, Any]]:
         page_number = page_info["page_number"]
 
         if not page_text:
-            # página vacía u OCR fallido
-            extracted = {}
+            # página vacía u OCR fallido: mismas columnas, todas vacías
+            extracted = empty_result()
         else:
-            extracted = extract_all(page_text)
+            extracted = extract_all(page_text).to_dict()
 
-        result = {
-            "archivo": basename,
-            "pagina": page_number,
-            "mode": mode,
-            **extracted,
-        }
-        page_results.append(result)
+        # to_dict entrega un dict nuevo por página: lo completamos en lugar
+        # de copiarlo
+        extracted["archivo"] = basename
+        extracted["pagina"] = page_number
+        extracted["mode"] = mode
+        page_results.append(extracted)
 
     return page_results
+
+
+def _init_worker() -> None:
+    """Inicializa cada proceso del pool: Tesseract con un solo hilo OpenMP."""
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def process_pdfs(
+    paths: Iterable[str], max_workers: Optional[int] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Procesa varios PDFs en paralelo, uno por proceso, y va entregando (yield)
+    el resultado de process_pdf de cada archivo en el mismo orden de `paths`.
+
+    Como los PDFs ya se reparten entre procesos, cada uno hace OCR con un
+    solo hilo para no sobresuscribir la CPU.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers or PDF_MAX_WORKERS,
+        initializer=_init_worker,
+    ) as ex:
+        yield from ex.map(partial(process_pdf, ocr_workers=1), paths)
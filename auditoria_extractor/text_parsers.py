@@ -8,8 +8,12 @@ Funciones para extraer campos relevantes de textos legales mineros
 
 from __future__ import annotations
 
-import regex as re
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .number_parser import text_number_to_int
 
@@ -20,68 +24,142 @@ from .number_parser import text_number_to_int
 
 def _normalize_spaces(text: str) -> str:
     """Colapsa espacios múltiples y normaliza saltos de línea simples."""
-    # Reemplaza saltos de línea por espacios en algunas búsquedas
-    return re.sub(r"\s+", " ", text, flags=re.UNICODE).strip()
+    # split() sin argumentos corta en cualquier espacio Unicode (igual que \s)
+    # y descarta los extremos; todo en C, sin pasar por el motor de regex
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=8)
+def _mayusculas(text: str) -> str:
+    """
+    Texto en mayúsculas con el mismo largo que el original.
+    Los patrones se buscan sobre esta versión (sin IGNORECASE, bastante más
+    rápido) y las capturas se recortan del original por posición.
+    Los caracteres que cambian de largo al pasar a mayúscula (ß, ligaduras
+    como 'ﬁ') quedan tal cual: con IGNORECASE tampoco coincidían.
+    La caché evita repetir la conversión en cada parser de la misma página.
+    """
+    up = text.upper()
+    if len(up) == len(text):
+        return up
+    return "".join(c.upper() if len(c.upper()) == 1 else c for c in text)
+
+
+def _original(text: str, m: re.Match, grupo: Any = 1) -> str:
+    """Captura de un match sobre _mayusculas(text), tomada del texto original."""
+    return text[m.start(grupo):m.end(grupo)]
+
+
+def _atomico(nombre: str, patron: str) -> str:
+    """
+    `patron` como grupo atómico: el lookahead captura el tramo más largo y
+    la referencia (?P=nombre) lo consume entero, sin devolverlo al
+    retroceder. Equivale a (?>...) / *+, que el re estándar solo acepta
+    desde Python 3.11.
+    """
+    return rf"(?=(?P<{nombre}>{patron}))(?P={nombre})"
+
+
+# Alternación de meses, compartida por los patrones de fechas
+MESES = (
+    "ENERO|FEBRERO|MARZO|ABRIL|MAYO|JUNIO|JULIO|AGOSTO|SEPTIEMBRE|OCTUBRE|NOVIEMBRE|DICIEMBRE"
+)
 
 
 # -----------------------------
 # Parsers de la carátula (certificado Conservador)
 # -----------------------------
 
+# Una sola pasada: 'MINAS\s+DE' cubre también la variante con un solo espacio
+_PAT_CONSERVADOR = re.compile(r"CONSERVADOR(?:A)? DE MINAS\s+DE\s+([A-ZÁÉÍÓÚÜÑ ]+)")
+_PREFIJO_CONSERVADOR = "Conservador de Minas de "
+
+
 def extract_conservador(text: str) -> Optional[str]:
     """
     Intenta extraer el nombre del Conservador de Minas, por ejemplo:
     'CONSERVADOR DE MINAS DE VALPARAÍSO'
+    El lugar va tal como aparece; extract_all lo capitaliza (ver _capitalizar).
     """
-    # Usamos versión con y sin tildes
-    patrones = [
-        r"CONSERVADOR(?:A)? DE MINAS DE\s+([A-ZÁÉÍÓÚÜÑ ]+)",
-        r"CONSERVADOR(?:A)? DE MINAS\s+DE\s+([A-ZÁÉÍÓÚÜÑ ]+)",
-    ]
-
-    for pat in patrones:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            lugar = m.group(1).strip()
-            # Normalizamos capitalización básica
-            lugar_norm = lugar.title()
-            return f"Conservador de Minas de {lugar_norm}"
+    m = _PAT_CONSERVADOR.search(_mayusculas(text))
+    if m:
+        lugar = _original(text, m).strip()
+        return _PREFIJO_CONSERVADOR + lugar
     return None
 
 
-def extract_nombre_concesion(text: str) -> Optional[str]:
+# Patrones probables del nombre, en orden de preferencia
+_PAT_NOMBRE_CONCESION = (
+    re.compile(r"INSCRIPCION DE MENSURA\s+\"?([A-Z0-9 ,/º\-]+)\"?"),
+    re.compile(r"MENSURA\s+\"?([A-Z0-9 ,/º\-]+)\"?"),
+    re.compile(r"CONCESI[ÓO]N MINERA DE EXPLOTACI[ÓO]N\s+\"?([A-Z0-9 ,/º\-]+)\"?"),
+)
+# fallback: nombre solo entre comillas (sensible a mayúsculas, como antes)
+_PAT_NOMBRE_COMILLAS = re.compile(r"\"([A-Z0-9 ,/º\-]+)\"")
+
+
+def extract_nombre_concesion(text: str, norm: Optional[str] = None) -> Optional[str]:
     """
     Busca patrones tipo:
     INSCRIPCION DE MENSURA "CURAUMA 2, 1 AL 15"
     MENSURA "CURAUMA 2, 1 AL 15"
     CONCESIÓN MINERA DE EXPLOTACIÓN CURAUMA 2, 1 AL 15
     """
-    # Unificamos espacios
-    norm = _normalize_spaces(text)
-
-    # Patrones probables
-    patrones = [
-        r"INSCRIPCION DE MENSURA\s+\"?([A-Z0-9 ,/º\-]+)\"?",
-        r"MENSURA\s+\"?([A-Z0-9 ,/º\-]+)\"?",
-        r"CONCESI[ÓO]N MINERA DE EXPLOTACI[ÓO]N\s+\"?([A-Z0-9 ,/º\-]+)\"?",
-    ]
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    for pat in patrones:
-        m = re.search(pat, norm, flags=re.IGNORECASE)
+    up = _mayusculas(norm)
+    for pat in _PAT_NOMBRE_CONCESION:
+        m = pat.search(up)
         if m:
-            nombre = m.group(1).strip(" \"")
+            nombre = _original(norm, m).strip(" \"")
             # evitamos capturar texto genérico muy corto
             if len(nombre) >= 4:
-                return nombre.title()
+                return nombre
 
-    # fallback: a veces el nombre va entre comillas solo
-    m2 = re.search(r"\"([A-Z0-9 ,/º\-]+)\"", norm)
+    # fallback: a veces el nombre va entre comillas solo (este sí distingue
+    # mayúsculas, así que va sobre el texto original)
+    m2 = _PAT_NOMBRE_COMILLAS.search(norm)
     if m2 and len(m2.group(1)) >= 4:
-        return m2.group(1).title()
+        return m2.group(1)
 
     return None
 
-def extract_titular(text: str) -> Optional[str]:
+# Cortes del nombre del titular (además de ',' y '.')
+_CORTE_TITULAR = r"\sINSCRITA|\sROLANTE|\sDEL\s+AÑO"
+# Nombre hasta el primer corte, sin backtracking: el primer carácter entra
+# siempre (como en el +? original) y el resto avanza en un tramo atómico
+# mientras no empiece un corte. Captura lo mismo que
+# '([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]+?)(?:,|...|\.)', pero en una sola pasada.
+_NOMBRE_TITULAR = (
+    r"([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]"
+    + _atomico("resto", rf"(?:(?!{_CORTE_TITULAR})[A-ZÁÉÍÓÚÜÑ0-9 &\-])*")
+    + rf")(?:,|{_CORTE_TITULAR}|\.)"
+)
+
+_PAT_TITULAR = (
+    # 1) Patrón típico de carátula: INSCRIPCION DE MENSURA ... DE <TITULAR>, INSCRITA EL ...
+    re.compile(r"INSCRIPCION DE MENSURA\s+\"[A-Z0-9 ,/º\-]+\"\s+DE\s+" + _NOMBRE_TITULAR),
+    # 2) A NOMBRE DE <...>
+    re.compile(r"A\s+NOMBRE\s+DE\s+" + _NOMBRE_TITULAR),
+    # 3) DE PROPIEDAD DE <...>
+    re.compile(r"DE\s+PROPIEDAD\s+DE\s+" + _NOMBRE_TITULAR),
+    # 4) TITULAR <...>
+    re.compile(r"TITULAR\s+" + _NOMBRE_TITULAR),
+)
+
+# Palabras con que no empieza un nombre/razón social
+_PRIMERAS_NO_TITULAR = frozenset({"SE", "LA", "EL", "ENTRE", "CINCUENTA", "CIENTO", "CERO", "INTERES"})
+# Marcas que suben el puntaje de un candidato; cada tupla va en una sola
+# alternación para revisarla con un search en vez de un `in` por marca.
+# Como los `in` de antes, son subcadenas (sin \b)
+_TAGS_RAZON_SOCIAL = ("S.A", "LTDA", "LIMITADA", "SPA", "S.P.A")
+_TAGS_EMPRESA = ("MINERA", "COMPAÑÍA", "COMPANIA", "SOCIEDAD")
+_PAT_RAZON_SOCIAL = re.compile("|".join(map(re.escape, _TAGS_RAZON_SOCIAL)))
+_PAT_EMPRESA = re.compile("|".join(map(re.escape, _TAGS_EMPRESA)))
+
+
+def extract_titular(text: str, norm: Optional[str] = None) -> Optional[str]:
     """
     Extrae el titular de la inscripción.
     Se prioriza:
@@ -89,32 +167,15 @@ def extract_titular(text: str) -> Optional[str]:
     - Expresiones: A NOMBRE DE <...>, DE PROPIEDAD DE <...>, TITULAR <...>.
     Intentamos ser más precisos y evitar párrafos largos.
     """
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
     candidatos: List[str] = []
 
-    # 1) Patrón típico de carátula: INSCRIPCION DE MENSURA ... DE <TITULAR>, INSCRITA EL ...
-    pat_caratula = (
-        r"INSCRIPCION DE MENSURA\s+\"[A-Z0-9 ,/º\-]+\"\s+DE\s+"
-        r"([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]+?)(?:,|\sINSCRITA|\sROLANTE|\sDEL\s+AÑO|\.)"
-    )
-    for m in re.finditer(pat_caratula, norm, flags=re.IGNORECASE):
-        candidatos.append(m.group(1).strip())
-
-    # 2) A NOMBRE DE <...>
-    pat_nombre = r"A\s+NOMBRE\s+DE\s+([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]+?)(?:,|\sINSCRITA|\sROLANTE|\sDEL\s+AÑO|\.)"
-    for m in re.finditer(pat_nombre, norm, flags=re.IGNORECASE):
-        candidatos.append(m.group(1).strip())
-
-    # 3) DE PROPIEDAD DE <...>
-    pat_prop = r"DE\s+PROPIEDAD\s+DE\s+([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]+?)(?:,|\sINSCRITA|\sROLANTE|\sDEL\s+AÑO|\.)"
-    for m in re.finditer(pat_prop, norm, flags=re.IGNORECASE):
-        candidatos.append(m.group(1).strip())
-
-    # 4) TITULAR <...>
-    pat_tit = r"TITULAR\s+([A-ZÁÉÍÓÚÜÑ0-9 \.&\-]+?)(?:,|\sINSCRITA|\sROLANTE|\sDEL\s+AÑO|\.)"
-    for m in re.finditer(pat_tit, norm, flags=re.IGNORECASE):
-        candidatos.append(m.group(1).strip())
+    up = _mayusculas(norm)
+    for pat in _PAT_TITULAR:
+        for m in pat.finditer(up):
+            candidatos.append(_original(norm, m).strip())
 
     if not candidatos:
         return None
@@ -131,8 +192,7 @@ def extract_titular(text: str) -> Optional[str]:
             return False
 
         # Evitar que empiece con palabras que no son nombre/razón social
-        primeras = {"SE", "LA", "EL", "ENTRE", "CINCUENTA", "CIENTO", "CERO", "INTERES"}
-        if palabras[0].upper() in primeras:
+        if palabras[0].upper() in _PRIMERAS_NO_TITULAR:
             return False
 
         return True
@@ -141,9 +201,9 @@ def extract_titular(text: str) -> Optional[str]:
         """Más puntaje si parece razón social."""
         s_u = s.upper()
         score = 0
-        if any(tag in s_u for tag in ["S.A", "LTDA", "LIMITADA", "SPA", "S.P.A"]):
+        if _PAT_RAZON_SOCIAL.search(s_u):
             score += 3
-        if any(tag in s_u for tag in ["MINERA", "COMPAÑÍA", "COMPANIA", "SOCIEDAD"]):
+        if _PAT_EMPRESA.search(s_u):
             score += 2
         # Bonus por 2+ palabras
         if len(s.split()) >= 2:
@@ -155,12 +215,15 @@ def extract_titular(text: str) -> Optional[str]:
     if not candidatos_filtrados:
         return None
 
-    # Elegimos el mejor según score
-    candidatos_filtrados.sort(key=score_titular, reverse=True)
-    titular = candidatos_filtrados[0]
-    return titular.title()
+    # Elegimos el mejor según score (ante empate, el primero, como el sort
+    # estable de antes)
+    return max(candidatos_filtrados, key=score_titular)
+
 
 
+# 'N°' opcional: con y sin él en una sola pasada
+_PAT_ROL = re.compile(r"ROL\s+NACIONAL\s+(?P<n>N[°º]\s*)?([0-9\.\-–]+)")
+
 
 def extract_rol_nacional(text: str) -> Optional[str]:
     """
@@ -168,19 +231,76 @@ def extract_rol_nacional(text: str) -> Optional[str]:
     'ROL NACIONAL N° 02201-01234-3'
     'ROL NACIONAL Nº 2201-1234-3'
     """
-    patrones = [
-        r"ROL\s+NACIONAL\s+N[°º]\s*([0-9\.\-–]+)",
-        r"ROL\s+NACIONAL\s+([0-9\.\-–]+)",
-    ]
-
-    for pat in patrones:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            return m.group(1).strip()
+    # Se prefiere la forma con 'N°'; si no aparece, la primera sin él
+    primero = None
+    # Solo se capturan dígitos y guiones: sirve tal cual desde las mayúsculas
+    for m in _PAT_ROL.finditer(_mayusculas(text)):
+        if m.group("n"):
+            return m.group(2).strip()
+        if primero is None:
+            primero = m
+    if primero:
+        return primero.group(2).strip()
     return None
 
 
-def extract_fojas_numero_anio(text: str) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
+# FOJAS / NUMERO / DEL AÑO en una sola pasada. Cada rama consume solo la
+# palabra clave y captura lo que sigue dentro de lookaheads opcionales, así
+# que una mención no se come a la siguiente: por cada grupo, su primera
+# captura es la misma que daría un search con el patrón suelto.
+_PAT_FOJAS_NUMERO_ANIO = re.compile(
+    r"FOJAS"
+    r"(?:(?=\s+(?P<fojas_ctx>.{0,80}))|)"
+    r"(?:(?=\s+(?P<fojas_txt>[A-ZÁÉÍÓÚÜÑ ]+?)"
+    r"(?:\s+VTA\.?|\s+VUELTA|\s+NUMERO|\s+N[°º]|\s+DEL\s+REGISTRO))|)"
+    r"(?:(?=\s+(?P<fojas_num>[0-9\.]+))|)"
+    r"|NUMERO"
+    r"(?:(?=\s+(?P<num_txt>[A-ZÁÉÍÓÚÜÑ ]+?)(?:\s+DEL\s+REGISTRO|\s+DEL\s+A[NÑ]O|\s+DEL\s+AÑO))|)"
+    r"(?:(?=\s+(?P<num_num>[0-9\.]+))|)"
+    r"|DEL\s+A[NÑ]O"
+    r"(?:(?=\s+(?P<anio_txt>[A-ZÁÉÍÓÚÜÑ ]+?)(?:[\,\.;]|$))|)"
+    r"(?:(?=\s+(?P<anio_num>[0-9]{4}))|)"
+)
+_N_GRUPOS_FOJAS = _PAT_FOJAS_NUMERO_ANIO.groups
+_PAT_VUELTA_CTX = re.compile(r"\b(VTA\.?|VUELTA)\b")
+_PAT_VUELTA = re.compile(r"\bVUELTA\b")
+
+
+def _primeras_capturas(norm: str) -> Dict[str, str]:
+    """Primera captura de cada grupo de _PAT_FOJAS_NUMERO_ANIO en el texto."""
+    capturas: Dict[str, str] = {}
+    for m in _PAT_FOJAS_NUMERO_ANIO.finditer(norm):
+        for nombre, valor in m.groupdict().items():
+            if valor is not None and nombre not in capturas:
+                capturas[nombre] = valor
+        if len(capturas) == _N_GRUPOS_FOJAS:
+            break
+    return capturas
+
+
+# Borra los puntos de miles en una pasada
+_SIN_PUNTOS = str.maketrans("", "", ".")
+
+
+def _entero(cadena: Optional[str]) -> Optional[int]:
+    """Entero desde dígitos con puntos de miles ('1.234' -> 1234), o None."""
+    if cadena is None:
+        return None
+    try:
+        return int(cadena.translate(_SIN_PUNTOS))
+    except ValueError:
+        return None
+
+
+def _vuelta(capturas: Dict[str, str]) -> str:
+    """'vta' si el trozo alrededor de la primera FOJAS dice VUELTA / VTA."""
+    ctx = capturas.get("fojas_ctx")
+    if ctx is not None and _PAT_VUELTA_CTX.search(ctx):
+        return "vta"
+    return ""
+
+
+def extract_fojas_numero_anio(text: str, norm: Optional[str] = None) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]:
     """
     Extrae:
     - fojas (en letras o números)
@@ -191,100 +311,69 @@ def extract_fojas_numero_anio(text: str) -> Tuple[Optional[int], Optional[int],
     Ejemplos:
     'ROLANTE A FOJAS SIETE VUELTA NUMERO CINCO DEL REGISTRO... DEL AÑO DOS MIL VEINTE'
     """
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
+    # Las capturas son palabras numéricas o dígitos: no hace falta el original
+    capturas = _primeras_capturas(_mayusculas(norm))
 
     # ------------------------------------
     # Detectar si dice VUELTA / VTA / VTA.
     # ------------------------------------
-    fojas_vuelta: Optional[str] = ""
-
-    # Tomamos un trozo alrededor de la palabra FOJAS
-    m_fojas_ctx = re.search(r"FOJAS\s+(.{0,80})", norm, flags=re.IGNORECASE)
-    if m_fojas_ctx:
-        ctx = m_fojas_ctx.group(1)
-        if re.search(r"\b(VTA\.?|VUELTA)\b", ctx, flags=re.IGNORECASE):
-            fojas_vuelta = "vta"
+    fojas_vuelta: Optional[str] = _vuelta(capturas)
 
     # ------------------------------------
     # FOJAS (número)
     # ------------------------------------
     fojas_val: Optional[int] = None
-    m_fojas_text = re.search(
-        r"FOJAS\s+([A-ZÁÉÍÓÚÜÑ ]+?)(?:\s+VTA\.?|\s+VUELTA|\s+NUMERO|\s+N[°º]|\s+DEL\s+REGISTRO)",
-        norm,
-        flags=re.IGNORECASE,
-    )
-    if m_fojas_text:
-        palabra_fojas = m_fojas_text.group(1).strip()
+    palabra_fojas = capturas.get("fojas_txt")
+    if palabra_fojas is not None:
         # Quitamos palabras tipo 'VUELTA' si quedara por error
-        palabra_fojas = re.sub(r"\bVUELTA\b", "", palabra_fojas, flags=re.IGNORECASE).strip()
+        palabra_fojas = _PAT_VUELTA.sub("", palabra_fojas.strip()).strip()
         if palabra_fojas:
             fojas_val = text_number_to_int(palabra_fojas)
     else:
         # backup: FOJAS <número>
-        m_fojas_num = re.search(r"FOJAS\s+([0-9\.]+)", norm, flags=re.IGNORECASE)
-        if m_fojas_num:
-            try:
-                fojas_val = int(m_fojas_num.group(1).replace(".", ""))
-            except ValueError:
-                fojas_val = None
+        fojas_val = _entero(capturas.get("fojas_num"))
 
     # ------------------------------------
     # NÚMERO INSCRIPCIÓN
     # ------------------------------------
     num_val: Optional[int] = None
-    m_num_text = re.search(
-        r"NUMERO\s+([A-ZÁÉÍÓÚÜÑ ]+?)(?:\s+DEL\s+REGISTRO|\s+DEL\s+A[NÑ]O|\s+DEL\s+AÑO)",
-        norm,
-        flags=re.IGNORECASE,
-    )
-    if m_num_text:
-        palabra_num = m_num_text.group(1).strip()
-        num_val = text_number_to_int(palabra_num)
+    palabra_num = capturas.get("num_txt")
+    if palabra_num is not None:
+        num_val = text_number_to_int(palabra_num.strip())
     else:
-        m_num_num = re.search(r"NUMERO\s+([0-9\.]+)", norm, flags=re.IGNORECASE)
-        if m_num_num:
-            try:
-                num_val = int(m_num_num.group(1).replace(".", ""))
-            except ValueError:
-                num_val = None
+        num_val = _entero(capturas.get("num_num"))
 
     # ------------------------------------
     # AÑO
     # ------------------------------------
     anio_val: Optional[int] = None
     # primero en letras
-    m_anio_text = re.search(
-        r"DEL\s+A[NÑ]O\s+([A-ZÁÉÍÓÚÜÑ ]+?)(?:[\,\.;]|$)",
-        norm,
-        flags=re.IGNORECASE,
-    )
-    if m_anio_text:
-        palabra_anio = m_anio_text.group(1).strip()
-        anio_val = text_number_to_int(palabra_anio)
+    palabra_anio = capturas.get("anio_txt")
+    if palabra_anio is not None:
+        anio_val = text_number_to_int(palabra_anio.strip())
     else:
-        m_anio_num = re.search(r"DEL\s+A[NÑ]O\s+([0-9]{4})", norm, flags=re.IGNORECASE)
-        if m_anio_num:
-            try:
-                anio_val = int(m_anio_num.group(1))
-            except ValueError:
-                anio_val = None
+        anio_val = _entero(capturas.get("anio_num"))
 
     return fojas_val, num_val, anio_val, fojas_vuelta
 
 
-def extract_fojas_vuelta(text: str) -> str:
+def extract_fojas_vuelta(text: str, norm: Optional[str] = None) -> str:
     """
     Devuelve 'vta' si el texto menciona que la fojas es vuelta.
     Si no menciona nada, devuelve ''.
+    Usa el mismo barrido de FOJAS que extract_fojas_numero_anio (sin
+    convertir los números), así ambos criterios no pueden desalinearse.
     """
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    # Casos reconocidos: VUELTA, VTA, VTA.
-    if re.search(r"FOJAS\s+[A-ZÁÉÍÓÚÜÑ0-9 \.,º\-]*(VUELTA|VTA\.?)", norm, flags=re.IGNORECASE):
-        return "vta"
+    return _vuelta(_primeras_capturas(_mayusculas(norm)))
 
-    return ""
+
+# Permitimos día en letras, mes en letras, resto libre
+_PAT_FECHA = re.compile(rf"([A-ZÁÉÍÓÚÜÑ ]+?\s+DE\s+(?:{MESES})\s+DEL\s+A[NÑ]O\s+[A-ZÁÉÍÓÚÜÑ ]+)")
 
 
 def extract_fecha_texto(text: str) -> Optional[str]:
@@ -293,39 +382,94 @@ def extract_fecha_texto(text: str) -> Optional[str]:
     'TREINTA DE DICIEMBRE DEL AÑO DOS MIL VEINTE'
     Por ahora la devolvemos como string crudo.
     """
-    # Permitimos día en letras, mes en letras, resto libre
-    meses = (
-        "ENERO|FEBRERO|MARZO|ABRIL|MAYO|JUNIO|JULIO|AGOSTO|SEPTIEMBRE|OCTUBRE|NOVIEMBRE|DICIEMBRE"
-    )
-
-    pat = rf"([A-ZÁÉÍÓÚÜÑ ]+?\s+DE\s+(?:{meses})\s+DEL\s+A[NÑ]O\s+[A-ZÁÉÍÓÚÜÑ ]+)"
-    m = re.search(pat, text, flags=re.IGNORECASE)
+    m = _PAT_FECHA.search(_mayusculas(text))
     if m:
-        return _normalize_spaces(m.group(1)).title()
+        return _normalize_spaces(_original(text, m))
     return None
 
-def classify_utm_match(text: str, start_idx: int, end_idx: int) -> str:
+# Marcas de contexto de classify_utm_match, por tipo de coordenada (en orden
+# de prioridad)
+_MARCAS_UTM = (
+    ("hito_mensura", ("HITO DE MENSURA", "H.M.")),
+    ("vertice", ("VERTICE", "VÉRTICE", "V-1", "V-2")),
+    ("lindero", ("LINDERO",)),
+)
+# Las mismas marcas, una alternación por tipo: la ventana se revisa con un
+# search por tipo en vez de un `in` por marca
+_PAT_MARCAS_UTM = tuple(
+    (tipo, re.compile("|".join(map(re.escape, marcas)))) for tipo, marcas in _MARCAS_UTM
+)
+
+
+def marcas_utm(text: str) -> Dict[str, List[int]]:
+    """
+    Posiciones (ordenadas) de cada marca de contexto en el texto.
+    Se calcula una vez por página y se pasa a classify_utm_match cuando hay
+    que clasificar muchos matches del mismo texto.
+    """
+    up = _mayusculas(text)
+    posiciones: Dict[str, List[int]] = {}
+    for _, marcas in _MARCAS_UTM:
+        for marca in marcas:
+            lista = []
+            i = up.find(marca)
+            while i != -1:
+                lista.append(i)
+                i = up.find(marca, i + 1)
+            posiciones[marca] = lista
+    return posiciones
+
+
+def classify_utm_match(
+    text: str, start_idx: int, end_idx: int, marcas: Optional[Dict[str, List[int]]] = None
+) -> str:
     """
     Mira el contexto alrededor del match (±80 caracteres) y trata de
     clasificar el tipo de coordenada: 'hito_mensura', 'vertice', 'lindero', etc.
+    Sin `marcas` busca cada tipo con _PAT_MARCAS_UTM sobre las mayúsculas
+    de la página, acotando con pos/endpos en vez de cortar la ventana.
+    Con `marcas` (de marcas_utm) no recorre la ventana: busca por bisección
+    si alguna marca cae completa dentro de ella.
     """
     window_size = 80
     inicio = max(0, start_idx - window_size)
     fin = min(len(text), end_idx + window_size)
-    contexto = text[inicio:fin].upper()
-
-    if "HITO DE MENSURA" in contexto or "H.M." in contexto:
-        return "hito_mensura"
-    if "VERTICE" in contexto or "VÉRTICE" in contexto or "V-1" in contexto or "V-2" in contexto:
-        return "vertice"
-    if "LINDERO" in contexto:
-        return "lindero"
+
+    if marcas is None:
+        up = _mayusculas(text)
+        for tipo, pat in _PAT_MARCAS_UTM:
+            if pat.search(up, inicio, fin):
+                return tipo
+        return "desconocido"
+
+    for tipo, lista in _MARCAS_UTM:
+        for marca in lista:
+            pos = marcas[marca]
+            k = bisect_left(pos, inicio)
+            if k < len(pos) and pos[k] + len(marca) <= fin:
+                return tipo
     return "desconocido"
 
+
 # -----------------------------
 # Parsers de cédulas, domicilios, juzgado, causa rol
 # -----------------------------
 
+def _sin_repetir(capturas: Iterable[str]) -> List[str]:
+    """
+    Capturas sin espacios en los extremos, sin vacías ni repetidas, en orden
+    de aparición (dict.fromkeys deduplica por hash, sin recorrer la lista).
+    """
+    return list(dict.fromkeys(c for c in map(str.strip, capturas) if c))
+
+
+_PAT_CEDULAS = (
+    re.compile(r"CEDULA(?: NACIONAL)? DE IDENTIDAD\s+N[°º]?\s*([\d\.\-kK]+)"),
+    re.compile(r"CEDULA(?: NACIONAL)? DE IDENTIDAD\s+NUMERO\s*([\d\.\-kK]+)"),
+    re.compile(r"RUT\s*([\d\.\-kK]+)"),
+)
+
+
 def extract_cedulas_identidad(text: str) -> List[str]:
     """
     Extrae posibles Cédulas/RUT desde el texto.
@@ -333,226 +477,421 @@ def extract_cedulas_identidad(text: str) -> List[str]:
     - "CEDULA NACIONAL DE IDENTIDAD N° 12.345.678-9"
     - "RUT 12.345.678-9"
     """
-    resultados: List[str] = []
     # Trabajamos sobre el texto tal cual (respetando puntos y guiones)
-    patrones = [
-        r"CEDULA(?: NACIONAL)? DE IDENTIDAD\s+N[°º]?\s*([\d\.\-kK]+)",
-        r"CEDULA(?: NACIONAL)? DE IDENTIDAD\s+NUMERO\s*([\d\.\-kK]+)",
-        r"RUT\s*([\d\.\-kK]+)",
-    ]
+    up = _mayusculas(text)
+    return _sin_repetir(_original(text, m) for pat in _PAT_CEDULAS for m in pat.finditer(up))
 
-    for pat in patrones:
-        for m in re.finditer(pat, text, flags=re.IGNORECASE):
-            ci = m.group(1).strip()
-            if ci and ci not in resultados:
-                resultados.append(ci)
 
-    return resultados
+_PAT_DOMICILIOS = (
+    re.compile(r"DOMICILIAD[OA]\s+EN\s+([^\,\.;]+)"),
+    re.compile(r"CON\s+DOMICILIO\s+EN\s+([^\,\.;]+)"),
+    re.compile(r"DOMICILIO\s+EN\s+([^\,\.;]+)"),
+)
 
 
-def extract_domicilios(text: str) -> List[str]:
+def extract_domicilios(text: str, norm: Optional[str] = None) -> List[str]:
     """
     Extrae posibles domicilios, buscando frases tipo:
     - 'domiciliado en Avenida ...'
     - 'domiciliada en calle ...'
     - 'con domicilio en ...'
     """
-    resultados: List[str] = []
-    norm = _normalize_spaces(text)
-
-    patrones = [
-        r"DOMICILIAD[OA]\s+EN\s+([^\,\.;]+)",
-        r"CON\s+DOMICILIO\s+EN\s+([^\,\.;]+)",
-        r"DOMICILIO\s+EN\s+([^\,\.;]+)",
-    ]
-
-    for pat in patrones:
-        for m in re.finditer(pat, norm, flags=re.IGNORECASE):
-            frag = m.group(1).strip()
-            if frag:
-                # Normalizamos un poco la dirección (capitalización básica)
-                dom = frag.strip()
-                # Evitamos duplicados
-                if dom not in resultados:
-                    resultados.append(dom)
-
-    return resultados
-
-
-def extract_juzgados(text: str) -> List[str]:
+    if norm is None:
+        norm = _normalize_spaces(text)
+
+    up = _mayusculas(norm)
+    return _sin_repetir(_original(norm, m) for pat in _PAT_DOMICILIOS for m in pat.finditer(up))
+
+
+# 'JUZGADO' y su denominación, tomada de un vocabulario cerrado ("DE LETRAS",
+# "CIVIL", "DEL CRIMEN", ordinales...), más un "DE <ciudad>" final con una
+# sola palabra libre. Antes cualquier palabra en mayúsculas contaba como
+# denominación y la captura seguía por la prosa ("... DE COPIAPO CERTIFICA
+# QUE LA PRESENTE ES").
+_ORDINAL_JUZGADO = (
+    r"(?:\d{1,2}\s*[°º]|PRIMER|SEGUNDO|TERCER|CUARTO|QUINTO|SEXTO|S[ÉE]PTIMO"
+    r"|OCTAVO|NOVENO|D[ÉE]CIMO)"
+)
+_DENOMINACION_JUZGADO = (
+    r"(?:DE\s+LETRAS|CIVIL|EN\s+LO\s+CIVIL|DEL\s+CRIMEN|DE\s+GARANT[ÍI]A"
+    r"|DE\s+FAMILIA|DEL\s+TRABAJO|DE\s+POLIC[ÍI]A\s+LOCAL|MIXTO"
+    r"|Y\s+(?:DE\s+)?GARANT[ÍI]A"
+    rf"|{_ORDINAL_JUZGADO})"
+)
+_LUGAR_JUZGADO = (
+    r"\s+DEL?\s+(?:(?:LA|LAS|LOS|EL|SAN|SANTA)\s+)?[A-ZÁÉÍÓÚÜÑ]+\b"
+)
+_PAT_JUZGADO = re.compile(
+    rf"((?:{_ORDINAL_JUZGADO}\s+)?JUZGADO"
+    rf"(?:(?:\s+{_DENOMINACION_JUZGADO}){{1,4}}(?:{_LUGAR_JUZGADO})?|{_LUGAR_JUZGADO}))"
+)
+
+
+def extract_juzgados(text: str, norm: Optional[str] = None) -> List[str]:
     """
     Extrae nombres de juzgados, p.ej.:
     - 'Juzgado de Letras de Valparaíso'
     - 'Segundo Juzgado Civil de Santiago'
     """
-    resultados: List[str] = []
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    # Tomamos desde 'JUZGADO' hasta el próximo signo fuerte o salto lógico
-    pat = r"(JUZGADO\s+[A-ZÁÉÍÓÚÜÑ0-9\s\-DELCIVILRA\.]+)"
-    for m in re.finditer(pat, norm, flags=re.IGNORECASE):
-        j = m.group(1).strip()
-        if j and j not in resultados:
-            resultados.append(j)
+    return _sin_repetir(_original(norm, m) for m in _PAT_JUZGADO.finditer(_mayusculas(norm)))
 
-    return resultados
 
+_PAT_CAUSAS_ROL = (
+    re.compile(r"CAUSA\s+ROL\s+N[°º]?\s*([A-Z0-9\.\-\/]+)"),
+    re.compile(r"CAUSA\s+ROL\s+([A-Z0-9\.\-\/]+)"),
+)
 
-def extract_causas_rol(text: str) -> List[str]:
+
+def extract_causas_rol(text: str, norm: Optional[str] = None) -> List[str]:
     """
     Extrae posibles 'causa rol', p.ej.:
     - 'causa Rol N° C-1234-2020'
     - 'causa rol 1234-2020'
     Sólo consideramos cuando aparece la palabra 'causa'.
     """
-    resultados: List[str] = []
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    patrones = [
-        r"CAUSA\s+ROL\s+N[°º]?\s*([A-Z0-9\.\-\/]+)",
-        r"CAUSA\s+ROL\s+([A-Z0-9\.\-\/]+)",
-    ]
-
-    for pat in patrones:
-        for m in re.finditer(pat, norm, flags=re.IGNORECASE):
-            rol = m.group(1).strip()
-            if rol and rol not in resultados:
-                resultados.append(rol)
-
-    return resultados
+    up = _mayusculas(norm)
+    return _sin_repetir(_original(norm, m) for pat in _PAT_CAUSAS_ROL for m in pat.finditer(up))
 
 
 # -----------------------------
 # Parsers de coordenadas UTM
 # -----------------------------
 
-def extract_utm_from_numbers(text: str) -> List[Dict[str, Any]]:
+# Formato chileno: '6.333.850,00' -> '6333850.00' en una sola pasada
+_COORD_TBL = str.maketrans({".": "", " ": "", ",": "."})
+
+
+def _limpiar_numero_coord(cadena: str) -> Optional[float]:
+    """Convierte una coordenada con miles '.' y decimales ',' a float (o None)."""
+    try:
+        return float(cadena.translate(_COORD_TBL))
+    except (ValueError, AttributeError):
+        return None
+
+
+# Fuentes de los patrones UTM; los nombres de grupo se completan con %
+# para que cada variante tenga los suyos.
+# Cada valor exige al menos un dígito: un "E." suelto (fin de palabra más
+# punto) no es coordenada y se comería al vértice real.
+# Separadores y valores son atómicos (ver _atomico): acortarlos nunca da un
+# vértice que el largo máximo no diera (el tramo que sigue solo llegaría
+# menos lejos), y así un casi-match falla sin reintentar cada largo del número.
+# Los grupos auxiliares toman el nombre del valor más un sufijo.
+# Las marcas N / E / NORTE / ESTE no pueden ir pegadas a una letra anterior:
+# si no, la 'E' final de "VÉRTICE 1" o "LINDERO ESTE" pasa por coordenada.
+_NO_LETRA = r"(?<![A-ZÁÉÍÓÚÜÑ])"
+_UTM_SEP = r"[\s:=]*"
+_UTM_VALOR = r"[\.\,]*[0-9][0-9\.\,]*"
+
+
+def _utm_valor(grupo: str) -> str:
+    """Separador y valor (en el grupo `grupo`, plantilla %) de una coordenada."""
+    return (
+        _atomico(grupo + "_sep", _UTM_SEP)
+        + rf"(?P<{grupo}>" + _atomico(grupo + "_val", _UTM_VALOR) + ")"
+    )
+
+
+# Caso genérico: Norte primero, luego Este
+_UTM_NORTE_ESTE = (
+    _NO_LETRA + r"(?:N(?:ORTE)?)" + _utm_valor("%(norte)s")
+    + r"(?:\s*(?:METROS|M))?"
+    r".{0,80}?"   # ← dejamos espacio para 'metros', 'UTM', etc.
+    + _NO_LETRA + r"(?:E(?:STE)?)" + _utm_valor("%(este)s")
+)
+# Variante: Este primero, luego Norte (por si acaso)
+_UTM_ESTE_NORTE = (
+    _NO_LETRA + r"(?:E(?:STE)?)" + _utm_valor("%(este)s")
+    + r"(?:\s*(?:METROS|M))?"
+    r".{0,80}?"
+    + _NO_LETRA + r"(?:N(?:ORTE)?)" + _utm_valor("%(norte)s")
+)
+# Patrón simplificado:
+# - Busca 'NORTE <palabras> COMA ... (ESTE|E) <palabras> COMA'
+# - El tramo entre ambos queda acotado (sin cruzar un punto) para que una
+#   página con NORTE pero sin ESTE falle rápido en vez de recorrerla entera
+# - Cada valor en letras también, a _LARGO_MAX_PALABRAS caracteres
+# Valor en letras más largo que entiende text_number_to_int (hasta
+# 999.999.999, con espacios ya normalizados): "cuatrocientos cincuenta y
+# cuatro millones cuatrocientos cincuenta y cuatro mil cuatrocientos
+# cincuenta y cuatro" tiene 111 caracteres
+_LARGO_MAX_PALABRAS = 111
+_UTM_PALABRAS = (
+    _NO_LETRA
+    + rf"NORTE\s+(?P<%(norte)s>[A-ZÁÉÍÓÚÜÑ\s]{{1,{_LARGO_MAX_PALABRAS}}}?)\s+COMA[^.]{{0,300}}?"
+    + _NO_LETRA
+    + rf"(?:ESTE|E)\s+(?P<%(este)s>[A-ZÁÉÍÓÚÜÑ\s]{{1,{_LARGO_MAX_PALABRAS}}}?)\s+COMA"
+)
+
+_UTM_NE = _UTM_NORTE_ESTE % {"norte": "ne_norte", "este": "ne_este"}
+_UTM_EN = _UTM_ESTE_NORTE % {"norte": "en_norte", "este": "en_este"}
+_UTM_PAL = _UTM_PALABRAS % {"norte": "pal_norte", "este": "pal_este"}
+
+# Cada variante va en su propia pasada y con precedencia: Norte→Este
+# primero, Este→Norte y en letras solo fuera de lo que ya se cubrió. En una
+# sola alternación gana el match más a la izquierda, y un "Este 200 metros"
+# de un lindero se llevaba el Norte del vértice que venía detrás.
+_PAT_UTM_NE = re.compile(_UTM_NE)
+_PAT_UTM_EN = re.compile(_UTM_EN)
+_PAT_UTM_PALABRAS = re.compile(_UTM_PAL)
+# (patrón, grupo norte, grupo este, origen), en orden de precedencia
+_RAMA_NE = (_PAT_UTM_NE, "ne_norte", "ne_este", "digits")
+_RAMA_EN = (_PAT_UTM_EN, "en_norte", "en_este", "digits")
+_RAMA_PAL = (_PAT_UTM_PALABRAS, "pal_norte", "pal_este", "words")
+
+
+def _valor_utm(raw: str, source: str) -> Optional[float]:
+    """Valor de una coordenada capturada, en dígitos o en palabras."""
+    if source == "digits":
+        return _limpiar_numero_coord(raw)
+    val = text_number_to_int(raw.strip())
+    return None if val is None else float(val)
+
+
+def _vertices_por_precedencia(
+    ramas: Tuple[Tuple[re.Pattern, str, str, str], ...], norm: str
+) -> List[Dict[str, Any]]:
+    """
+    Vértices de varias pasadas sobre el texto normalizado. Cada rama solo
+    aporta matches que no se solapan con los de las ramas anteriores (así el
+    mismo par no sale dos veces, leído en los dos sentidos); el resultado
+    queda en orden de aparición, con el "tipo" de classify_utm_match.
+    """
+    # Dígitos o palabras numéricas: se leen directo de las mayúsculas
+    up = _mayusculas(norm)
+    tomados: List[Tuple[int, int, Optional[Dict[str, Any]]]] = []
+    for pat, g_norte, g_este, source in ramas:
+        previos = [(ini, fin) for ini, fin, _ in tomados]
+        for m in pat.finditer(up):
+            ini, fin = m.span()
+            if any(ini < f and i < fin for i, f in previos):
+                continue
+            n_raw, e_raw = m.group(g_norte, g_este)
+            n_val = _valor_utm(n_raw, source)
+            e_val = _valor_utm(e_raw, source)
+            vertice = None
+            if n_val is not None and e_val is not None:
+                vertice = {"norte": n_val, "este": e_val, "source": source}
+            # El tramo queda cubierto aunque el valor no se pueda leer
+            tomados.append((ini, fin, vertice))
+    tomados.sort(key=lambda t: t[0])
+    vertices = [(ini, fin, v) for ini, fin, v in tomados if v is not None]
+    if not vertices:
+        return []
+
+    # Tipo de cada vértice según su contexto; las marcas se ubican una sola
+    # vez por página y cada vértice se clasifica por bisección
+    marcas = marcas_utm(norm)
+    for ini, fin, v in vertices:
+        v["tipo"] = classify_utm_match(norm, ini, fin, marcas)
+    return [v for _, _, v in vertices]
+
+
+def extract_utm_from_numbers(text: str, norm: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Extrae coordenadas UTM cuando están como números, p.ej.:
     N=6.333.850,00  E=258.350,00
     Norte 6.333.850 metros, Este 258.350 metros
     Coordenadas U.T.M. Norte 6.333.850 Este 258.350
     """
-    results: List[Dict[str, Any]] = []
-
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    patrones = [
-        # Caso genérico: Norte primero, luego Este
-        r"(?:N(?:ORTE)?)[\s:=]*"
-        r"(?P<norte>[0-9\.\,]+)"
-        r"(?:\s*(?:METROS|M))?"
-        r".{0,80}?"   # ← dejamos espacio para 'metros', 'UTM', etc.
-        r"(?:E(?:STE)?)[\s:=]*"
-        r"(?P<este>[0-9\.\,]+)",
-
-        # Variante: Este primero, luego Norte (por si acaso)
-        r"(?:E(?:STE)?)[\s:=]*"
-        r"(?P<este>[0-9\.\,]+)"
-        r"(?:\s*(?:METROS|M))?"
-        r".{0,80}?"
-        r"(?:N(?:ORTE)?)[\s:=]*"
-        r"(?P<norte>[0-9\.\,]+)",
-    ]
-
-    for pat in patrones:
-        for m in re.finditer(pat, norm, flags=re.IGNORECASE):
-            n_raw = m.groupdict().get("norte")
-            e_raw = m.groupdict().get("este")
-            if not n_raw or not e_raw:
-                continue
-            try:
-                n_val = float(n_raw.replace(".", "").replace(",", "."))
-                e_val = float(e_raw.replace(".", "").replace(",", "."))
-                results.append({"norte": n_val, "este": e_val, "source": "digits"})
-            except ValueError:
-                continue
+    return _vertices_por_precedencia((_RAMA_NE, _RAMA_EN), norm)
 
-    return results
 
-def extract_utm_from_words(text: str) -> List[Dict[str, Any]]:
+def extract_utm_from_words(text: str, norm: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Extrae coordenadas UTM cuando están en letras, p.ej.:
     'Norte seis millones trescientos treinta y tres mil ochocientos cincuenta coma cero cero metros,
      Este dos millones ciento veinte mil coma cero cero metros'
     """
-    results: List[Dict[str, Any]] = []
-
-    norm = _normalize_spaces(text)
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    # Patrón simplificado:
-    # - Busca 'NORTE <palabras> COMA ... (ESTE|E) <palabras> COMA'
-    pat = r"NORTE\s+([a-záéíóúüñ\s]+?)\s+COMA.*?(?:ESTE|E)\s+([a-záéíóúüñ\s]+?)\s+COMA"
+    return _vertices_por_precedencia((_RAMA_PAL,), norm)
 
-    for m in re.finditer(pat, norm, flags=re.IGNORECASE | re.DOTALL):
-        norte_txt = m.group(1).strip()
-        este_txt = m.group(2).strip()
 
-        n_val = text_number_to_int(norte_txt)
-        e_val = text_number_to_int(este_txt)
-
-        if n_val is not None and e_val is not None:
-            results.append(
-                {
-                    "norte": float(n_val),
-                    "este": float(e_val),
-                    "source": "words",
-                }
-            )
+def extract_utm_vertices(text: str, norm: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Combina extracción numérica y en letras; los vértices quedan en orden de
+    aparición y no se solapan (ver _vertices_por_precedencia).
+    """
+    if norm is None:
+        norm = _normalize_spaces(text)
 
-    return results
+    return _vertices_por_precedencia((_RAMA_NE, _RAMA_EN, _RAMA_PAL), norm)
 
 
+# -----------------------------
+# Wrapper principal
+# -----------------------------
 
+# Por debajo de este largo (o sin letras) la página es ruido de OCR. Es bajo
+# a propósito: una página con solo "ROL NACIONAL 2201-1234" o un vértice
+# "N=6.333.850 E=258.350" sigue teniendo campos que extraer
+_MIN_PAGE_LEN = 12
 
 
-def extract_utm_vertices(text: str) -> List[Dict[str, Any]]:
-    """Combina extracción numérica y en letras."""
-    verts: List[Dict[str, Any]] = []
-    verts.extend(extract_utm_from_numbers(text))
-    verts.extend(extract_utm_from_words(text))
-    return verts
+def _menciona(up: str, *palabras: str) -> bool:
+    """True si alguna de las palabras aparece en el texto (ya en mayúsculas)."""
+    return any(p in up for p in palabras)
 
 
-# -----------------------------
-# Wrapper principal
-# -----------------------------
+@dataclass(slots=True, frozen=True)
+class Extraction:
+    """
+    Campos extraídos de una página (resultado de extract_all).
+    Es inmutable (y hashable), así que extract_all puede entregar el mismo
+    objeto desde la caché: cada vértice UTM se guarda como tupla de pares
+    (clave, valor) y to_dict lo vuelve a entregar como dict.
+    """
 
-def extract_all(text: str) -> Dict[str, Any]:
+    rol_nacional: Optional[str] = None
+    nombre_concesion: Optional[str] = None
+    fojas: Optional[int] = None
+    fojas_vuelta: str = ""
+    numero_inscripcion: Optional[int] = None
+    anio_inscripcion: Optional[int] = None
+    conservador: Optional[str] = None
+    fecha_texto: Optional[str] = None
+    titular: Optional[str] = None
+    utm_vertices: Tuple[Tuple[Tuple[str, Any], ...], ...] = ()
+    cedulas_identidad: Tuple[str, ...] = ()
+    domicilios: Tuple[str, ...] = ()
+    juzgados: Tuple[str, ...] = ()
+    causas_rol: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """dict nuevo con las claves de siempre (listas en vez de tuplas)."""
+        return {
+            "rol_nacional": self.rol_nacional,
+            "nombre_concesion": self.nombre_concesion,
+            "fojas": self.fojas,
+            "fojas_vuelta": self.fojas_vuelta,
+            "numero_inscripcion": self.numero_inscripcion,
+            "anio_inscripcion": self.anio_inscripcion,
+            "conservador": self.conservador,
+            "fecha_texto": self.fecha_texto,
+            "titular": self.titular,
+            "utm_vertices": [dict(v) for v in self.utm_vertices],
+            "cedulas_identidad": list(self.cedulas_identidad),
+            "domicilios": list(self.domicilios),
+            "juzgados": list(self.juzgados),
+            "causas_rol": list(self.causas_rol),
+        }
+
+
+_VACIO = Extraction()
+
+
+def empty_result() -> Dict[str, Any]:
+    """Resultado de extract_all sin ningún campo encontrado, como dict (mismas claves)."""
+    return _VACIO.to_dict()
+
+
+# Páginas cuyo resultado se recuerda (p.ej. al reprocesar el mismo PDF)
+_CACHE_PAGINAS = 256
+
+
+def _capitalizar(data: Dict[str, Any]) -> None:
+    """Capitalización básica (.title()) de los campos de texto libre, en el lugar."""
+    for clave in ("nombre_concesion", "titular", "fecha_texto"):
+        if data[clave]:
+            data[clave] = data[clave].title()
+    conservador = data["conservador"]
+    if conservador:
+        lugar = conservador[len(_PREFIJO_CONSERVADOR):]
+        data["conservador"] = _PREFIJO_CONSERVADOR + lugar.title()
+
+
+@lru_cache(maxsize=_CACHE_PAGINAS)
+def extract_all(text: str, pretty: bool = True) -> Extraction:
     """
     Parser principal: dado el texto de una página, intenta extraer
     todos los campos relevantes disponibles.
-    """
-    data: Dict[str, Any] = {}
 
-    # Campos "clásicos"
-    data["rol_nacional"] = extract_rol_nacional(text)
-    data["nombre_concesion"] = extract_nombre_concesion(text)
+    Con pretty=True (por defecto) capitaliza nombre de concesión, titular,
+    conservador y fecha; con False los deja como aparecen en el texto.
+
+    Los resultados quedan en caché por (texto, pretty); como Extraction es
+    inmutable, se entrega el mismo objeto. Para un dict propio, .to_dict().
+    """
+    # Páginas casi vacías o con basura de OCR: nos saltamos todos los regex.
+    # La letra se busca en todo el texto (una tabla de coordenadas puede
+    # ocupar el comienzo de la página); any() corta en la primera
+    if len(text) < _MIN_PAGE_LEN or not any(c.isalpha() for c in text):
+        return _VACIO
 
-    fojas, num_insc, anio, fojas_vta = extract_fojas_numero_anio(text)
+    data = empty_result()
 
-    data["fojas"] = fojas
-    data["fojas_vuelta"] = fojas_vta   # 👈 AÑADIDO
-    data["numero_inscripcion"] = num_insc
-    data["anio_inscripcion"] = anio
+    # Espacios colapsados una sola vez por página: los parsers que trabajan
+    # sobre el texto normalizado lo reciben como `norm` en vez de rehacerlo
+    norm = _normalize_spaces(text)
 
-    data["conservador"] = extract_conservador(text)
-    data["fecha_texto"] = extract_fecha_texto(text)
+    # Prefiltro: cada parser solo corre si en la página aparece alguna de las
+    # palabras que su patrón exige (un `in` es mucho más barato que un regex
+    # que recorre todo el texto para fallar). Si no, el campo queda vacío.
+    up = _mayusculas(norm)
 
-    
-    data["titular"] = extract_titular(text)
+    # Campos "clásicos"
+    if "NACIONAL" in up:
+        data["rol_nacional"] = extract_rol_nacional(text)
+    if _menciona(up, "MENSURA", "CONCESI", '"'):
+        data["nombre_concesion"] = extract_nombre_concesion(text, norm)
 
-    data["utm_vertices"] = extract_utm_vertices(text)
+    if _menciona(up, "FOJAS", "NUMERO", "DEL"):
+        fojas, num_insc, anio, fojas_vta = extract_fojas_numero_anio(text, norm)
 
-    # 🔹 NUEVOS CAMPOS
-    data["cedulas_identidad"] = extract_cedulas_identidad(text)
-    data["domicilios"] = extract_domicilios(text)
-    data["juzgados"] = extract_juzgados(text)
-    data["causas_rol"] = extract_causas_rol(text)
+        data["fojas"] = fojas
+        data["fojas_vuelta"] = fojas_vta
+        data["numero_inscripcion"] = num_insc
+        data["anio_inscripcion"] = anio
 
-    # (aquí ya estabas llenando "titular" en tu versión actual;
-    # si lo tienes en otra función, simplemente asegúrate de seguirlo poniendo aquí)
+    if "CONSERVADOR" in up:
+        data["conservador"] = extract_conservador(text)
+    if "DEL A" in up:
+        data["fecha_texto"] = extract_fecha_texto(text)
+    if _menciona(up, "MENSURA", "NOMBRE", "PROPIEDAD", "TITULAR"):
+        data["titular"] = extract_titular(text, norm)
 
-    return data
+    # Sin prefiltro: la variante numérica solo exige una 'N' y una 'E'
+    data["utm_vertices"] = extract_utm_vertices(text, norm)
 
+    # 🔹 NUEVOS CAMPOS
+    if _menciona(up, "CEDULA", "RUT"):
+        data["cedulas_identidad"] = extract_cedulas_identidad(text)
+    if "DOMICILI" in up:
+        data["domicilios"] = extract_domicilios(text, norm)
+    if "JUZGADO" in up:
+        data["juzgados"] = extract_juzgados(text, norm)
+    if "CAUSA" in up:
+        data["causas_rol"] = extract_causas_rol(text, norm)
+
+    if pretty:
+        _capitalizar(data)
+
+    data["utm_vertices"] = [tuple(v.items()) for v in data["utm_vertices"]]
+    for clave, valor in data.items():
+        if isinstance(valor, list):
+            data[clave] = tuple(valor)
+    return Extraction(**data)
+
+
+def extract_all_batch(texts: Iterable[str], workers: Optional[int] = None) -> List[Extraction]:
+    """
+    Aplica extract_all a muchos textos en paralelo (un proceso por núcleo si
+    workers es None) y devuelve los resultados en el mismo orden.
 
+    Solo conviene con lotes grandes: cada texto viaja entre procesos, así
+    que por debajo de ~1 ms de parseo por texto es más rápido llamar a
+    extract_all en un simple loop.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(extract_all, texts, chunksize=16))
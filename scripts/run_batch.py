@@ -3,54 +3,120 @@
 """
 run_batch.py
 Ejecuta el pipeline sobre todos los PDFs de una carpeta y
-guarda los resultados en un CSV.
+guarda los resultados en un CSV y en un NDJSON (un objeto JSON por línea).
+Las filas se escriben a medida que termina cada PDF.
 """
 
+import argparse
+import csv
 import os
-import sys
-import glob
 import json
-import pandas as pd
+from contextlib import ExitStack
+from itertools import tee
+from typing import Any, Dict, Iterator, Optional
 
-from auditoria_extractor.pipeline import process_pdf
+try:
+    import orjson  # opcional: serializa JSON en Rust, bastante más rápido
+except ImportError:
+    orjson = None
+
+from auditoria_extractor.pipeline import process_pdfs
 from auditoria_extractor.config import OUTPUT_DIR
+from auditoria_extractor.text_parsers import empty_result
 
+# archivo / pagina / mode primero, luego los campos extraídos
+COLUMNAS = ["archivo", "pagina", "mode", *empty_result()]
 
-def main(input_folder: str):
-    pattern = os.path.join(input_folder, "*.pdf")
-    files = glob.glob(pattern)
 
-    all_rows = []
+def _linea_json(row: Dict[str, Any]) -> bytes:
+    """Fila como una línea NDJSON en UTF-8 (con orjson si está instalado)."""
+    if orjson is not None:
+        return orjson.dumps(row) + b"\n"
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8")
 
-    for f in files:
-        print(f"[INFO] Procesando {f}...")
-        rows = process_pdf(f)
-        all_rows.extend(rows)
 
-    if not all_rows:
-        print("[WARN] No se encontró información para exportar.")
+def iter_pdfs(folder: str) -> Iterator[str]:
+    """
+    Rutas de los PDFs de la carpeta, a medida que se leen del directorio
+    (sin armar la lista completa antes de empezar a procesar).
+    Como el glob '*.pdf' de antes, se saltan los archivos ocultos, y una
+    carpeta inexistente no tiene PDFs.
+    """
+    try:
+        it = os.scandir(folder)
+    except FileNotFoundError:
+        print(f"[WARN] La carpeta no existe: {folder}")
         return
+    with it:
+        for e in it:
+            if (
+                e.name.lower().endswith(".pdf")
+                and not e.name.startswith(".")
+                and e.is_file()
+            ):
+                yield e.path
+
 
-    # --- CSV ---
-    df = pd.DataFrame(all_rows)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+def main(input_folder: str, workers: Optional[int] = None):
+    # Una copia de las rutas va al pool y la otra acompaña cada resultado
+    files, paths = tee(iter_pdfs(input_folder))
 
     out_path = os.path.join(OUTPUT_DIR, "auditoria_resultados.csv")
-    df.to_csv(out_path, index=False, encoding="utf-8-sig")
-    print(f"[OK] Resultados guardados en: {out_path}")
+    json_path = os.path.join(OUTPUT_DIR, "auditoria_resultados.jsonl")
+    n_files = n_rows = 0
+
+    print(f"[INFO] Procesando PDFs de {input_folder}...")
+    with ExitStack() as stack:
+        writer = jf = None
+        for f, rows in zip(files, process_pdfs(paths, max_workers=workers)):
+            n_files += 1
+            print(f"[INFO] Procesado {f}")
+            if not rows:
+                continue
+
+            # Los archivos se abren con la primera fila: sin resultados no
+            # se deja un CSV vacío
+            if writer is None:
+                os.makedirs(OUTPUT_DIR, exist_ok=True)
+                cf = stack.enter_context(
+                    open(out_path, "w", newline="", encoding="utf-8-sig")
+                )
+                jf = stack.enter_context(open(json_path, "wb"))
+                writer = csv.DictWriter(cf, fieldnames=COLUMNAS)
+                writer.writeheader()
 
-    # --- JSON ---
-    json_path = os.path.join(OUTPUT_DIR, "auditoria_resultados.json")
-    with open(json_path, "w", encoding="utf-8") as jf:
-        json.dump(all_rows, jf, ensure_ascii=False, indent=2)
-    print(f"[OK] Resultados JSON guardados en: {json_path}")
+            # --- CSV ---
+            writer.writerows(rows)
+            cf.flush()
 
+            # --- NDJSON ---
+            jf.writelines(_linea_json(row) for row in rows)
+            jf.flush()
+
+            n_rows += len(rows)
+
+    print(f"[INFO] {n_files} PDFs procesados.")
+    if not n_rows:
+        print("[WARN] No se encontró información para exportar.")
+        return
+
+    print(f"[OK] Resultados guardados en: {out_path}")
+    print(f"[OK] Resultados JSON (NDJSON) guardados en: {json_path}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Uso: python scripts/run_batch.py <carpeta_con_pdfs>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Procesa todos los PDFs de una carpeta y exporta CSV/JSON."
+    )
+    parser.add_argument("input_dir", help="carpeta con PDFs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="PDFs en paralelo (por defecto, config.PDF_MAX_WORKERS)",
+    )
+    args = parser.parse_args()
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"la carpeta no existe: {args.input_dir}")
 
-    input_dir = sys.argv[1]
-    main(input_dir)
+    main(args.input_dir, workers=args.workers)
@@ -0,0 +1,103 @@
+import unittest
+
+from auditoria_extractor.text_parsers import (
+    extract_all,
+    extract_juzgados,
+    extract_utm_from_numbers,
+    extract_utm_vertices,
+)
+
+
+def _pares(vertices):
+    return [(v["norte"], v["este"]) for v in vertices]
+
+
+class ExtractUtmFromNumbersTest(unittest.TestCase):
+    def test_norte_este_basico(self):
+        self.assertEqual(
+            _pares(extract_utm_from_numbers("N=6.333.850,00 E=258.350,00")),
+            [(6333850.0, 258350.0)],
+        )
+
+    def test_este_norte(self):
+        self.assertEqual(
+            _pares(extract_utm_from_numbers("Este 258.350 metros, Norte 6.333.850 metros")),
+            [(6333850.0, 258350.0)],
+        )
+
+    def test_este_de_lindero_no_se_lleva_el_norte(self):
+        texto = "lindero Este 200 metros, N 6.333.850 E 258.350"
+        self.assertEqual(_pares(extract_utm_from_numbers(texto)), [(6333850.0, 258350.0)])
+
+    def test_e_final_de_vertice_no_es_marca(self):
+        texto = "VERTICE 2 N=6.333.900,00 E=258.400,00"
+        self.assertEqual(_pares(extract_utm_from_numbers(texto)), [(6333900.0, 258400.0)])
+
+
+class ExtractUtmVerticesTest(unittest.TestCase):
+    def test_dos_vertices_seguidos(self):
+        texto = (
+            "Vértice 1: Norte 6.333.850 Este 258.350; "
+            "Vértice 2: Norte 6.333.900 Este 258.400"
+        )
+        self.assertEqual(
+            _pares(extract_utm_vertices(texto)),
+            [(6333850.0, 258350.0), (6333900.0, 258400.0)],
+        )
+
+    def test_numero_de_vertice_no_es_coordenada(self):
+        texto = "VERTICE 2 N=6.333.900,00 E=258.400,00"
+        self.assertEqual(_pares(extract_utm_vertices(texto)), [(6333900.0, 258400.0)])
+
+    def test_letras_y_digitos_en_orden_de_aparicion(self):
+        texto = (
+            "Norte seis millones coma cero cero metros, "
+            "Este dos mil coma cero cero metros. N 1 E 2"
+        )
+        self.assertEqual(
+            [(v["norte"], v["este"], v["source"]) for v in extract_utm_vertices(texto)],
+            [(6000000.0, 2000.0, "words"), (1.0, 2.0, "digits")],
+        )
+
+    def test_tipo_segun_contexto(self):
+        relleno = " texto" * 20
+        texto = f"HITO DE MENSURA N=6.333.850 E=258.350;{relleno} V-2 N=1.000 E=2.000;{relleno}"
+        self.assertEqual(
+            [v["tipo"] for v in extract_utm_vertices(texto)],
+            ["hito_mensura", "vertice"],
+        )
+
+
+class ExtractJuzgadosTest(unittest.TestCase):
+    def test_no_captura_la_prosa_siguiente(self):
+        texto = "EL JUZGADO DE LETRAS DE COPIAPO CERTIFICA QUE LA PRESENTE ES COPIA FIEL"
+        self.assertEqual(extract_juzgados(texto), ["JUZGADO DE LETRAS DE COPIAPO"])
+
+    def test_ordinal_y_ciudad(self):
+        self.assertEqual(
+            extract_juzgados("Segundo Juzgado Civil de Santiago, causa Rol C-12-2020"),
+            ["Segundo Juzgado Civil de Santiago"],
+        )
+
+
+class ExtractAllTest(unittest.TestCase):
+    def test_resultado_hashable_y_to_dict_con_dicts(self):
+        resultado = extract_all("HITO DE MENSURA N=6.333.850 E=258.350 del predio")
+        hash(resultado)
+        self.assertEqual(
+            resultado.to_dict()["utm_vertices"],
+            [{"norte": 6333850.0, "este": 258350.0, "source": "digits", "tipo": "hito_mensura"}],
+        )
+
+    def test_pagina_corta_con_rol(self):
+        self.assertEqual(extract_all("ROL NACIONAL 2201-1234").rol_nacional, "2201-1234")
+
+    def test_pagina_corta_con_vertice(self):
+        self.assertEqual(
+            _pares(extract_all("N=6.333.850 E=258.350").to_dict()["utm_vertices"]),
+            [(6333850.0, 258350.0)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()